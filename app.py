@@ -1,71 +1,396 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import logging
-import tempfile
+import hashlib
+import io
 import os
+import time
+from pathlib import Path
 from database import Database
 
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+import pyarrow as pa
+from pyarrow import csv as pacsv
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    filename="spark_search.log"
+)
+logger = logging.getLogger(__name__)
+
+APP_CSS = """
+<style>
+    body, .stApp {
+        background-color: #333333 !important; /* Dark Grey Background */
+        color: white !important;
+    }
+
+    .st-emotion-cache-1v0mbdj { display: none !important; } /* Hide GitHub icon */
+
+
+    .sidebar .sidebar-content {
+        background-color: white !important;
+        border-radius: 10px;
+        padding: 20px;
+    }
+
+    h1, h2, h3, h4, h5, h6, label, .stTextInput, .stTextInput label, 
+    .stRadio label, .stCheckbox label, .stSelectbox label, .stMultiselect label {
+        color: #2196F3 !important; /* Blue Text */
+    }
+
+    .stButton > button {
+        background-color: #2196F3 !important; /* Blue Buttons */
+        color: white !important;
+        border-radius: 5px;
+    }
+
+    .stTextInput > div > input, .stSelectbox div, .stMultiselect div {
+        background-color: white !important;
+        border: 1px solid #2196F3 !important;
+        color: #2196F3 !important;
+    }
+
+    .stSlider .st-bp {
+        color: #2196F3 !important;
+    }
+
+    .stAlert {
+        color: #2196F3 !important;
+    }
+</style>
+"""
+
+# Parsed uploads hold personal data, so they live in a private per-user app cache, not shared tmp
+PARQUET_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "spark_search" / "parquet"
+PARQUET_CACHE_MAX_BYTES = 1 << 30  # 1 GiB
+PARQUET_CACHE_MAX_AGE = 7 * 24 * 3600  # Seconds since last use
+PARTIAL_MAX_AGE = 3600  # Older *.partial files are leftovers from interrupted writes
+PARSER_VERSION = 2  # Part of the cache key; bump whenever _read_upload's output changes
+
+def _ensure_parquet_cache_dir() -> None:
+    """Create the cache directory readable by the current user only."""
+    PARQUET_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+    PARQUET_CACHE_DIR.chmod(0o700)
+
+def _sweep_parquet_cache() -> None:
+    """Evict stale or least recently used parquet files and orphaned partial writes."""
+    now = time.time()
+    try:
+        for f in PARQUET_CACHE_DIR.glob("*.partial"):
+            if now - f.stat().st_mtime > PARTIAL_MAX_AGE:
+                f.unlink(missing_ok=True)
+
+        files = sorted(PARQUET_CACHE_DIR.glob("*.parquet"), key=lambda f: f.stat().st_mtime, reverse=True)
+        total = 0
+        for f in files:
+            stat = f.stat()
+            total += stat.st_size
+            if total > PARQUET_CACHE_MAX_BYTES or now - stat.st_mtime > PARQUET_CACHE_MAX_AGE:
+                f.unlink(missing_ok=True)
+    except OSError as e:  # e.g. a concurrent session removed a file mid-sweep
+        logger.warning(f"Parquet cache sweep failed: {e}")
+
+@st.cache_resource
+def _get_db() -> Database:
+    """Share a single Database instance across all sessions."""
+    return Database()
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _parse_upload(data: bytes, name: str) -> pd.DataFrame:
+    """Parse uploaded CSV/Excel bytes into a DataFrame (memoized across reruns and restarts)."""
+    cache_path = PARQUET_CACHE_DIR / f"v{PARSER_VERSION}-{hashlib.blake2b(data).hexdigest()}.parquet"
+    if cache_path.exists():
+        try:
+            df = pd.read_parquet(cache_path, engine="pyarrow")
+            cache_path.touch()  # Mark as recently used for the LRU sweep
+            _sweep_parquet_cache()
+            return df
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable parquet cache {cache_path}: {e}")
+
+    df = _stringify_mixed_columns(_read_upload(data, name))
+    try:
+        _ensure_parquet_cache_dir()
+        partial_path = cache_path.with_suffix(".partial")
+        df.to_parquet(partial_path, compression="zstd", engine="pyarrow", index=False)
+        partial_path.replace(cache_path)  # Atomic, so readers never see a half-written file
+        _sweep_parquet_cache()
+    except Exception as e:
+        logger.warning(f"Could not write parquet cache {cache_path}: {e}")
+    return df
+
+def _stringify_mixed_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Store mixed int/text object columns (common in Excel) as text so Arrow/parquet accept them."""
+    for col in df.select_dtypes("object").columns:
+        if pd.api.types.infer_dtype(df[col], skipna=True) in ("mixed", "mixed-integer"):
+            df[col] = df[col].where(df[col].isna(), df[col].astype(str))
+    return df
+
+def _pandas_style_names(names: list) -> list:
+    """Rename blank/duplicate headers the way pd.read_csv does ("Unnamed: 2", "Skill.1")."""
+    names = [name if name else f"Unnamed: {i}" for i, name in enumerate(names)]
+    taken = set(names)
+    counts = {}
+    result = []
+    for name in names:
+        count = counts.get(name, 0)
+        counts[name] = count + 1
+        if count:
+            renamed = f"{name}.{count}"
+            while renamed in taken:
+                count += 1
+                renamed = f"{name}.{count}"
+            counts[name] = count + 1
+            taken.add(renamed)
+            name = renamed
+        result.append(name)
+    return result
+
+def _read_upload(data: bytes, name: str) -> pd.DataFrame:
+    """Parse uploaded CSV/Excel bytes into a DataFrame."""
+    if name.endswith(".csv"):
+        # Multi-threaded block parsing; quoted cells may span lines (e.g. resume summaries)
+        try:
+            table = pacsv.read_csv(
+                io.BytesIO(data),
+                read_options=pacsv.ReadOptions(block_size=8 << 20, use_threads=True),
+                parse_options=pacsv.ParseOptions(newlines_in_values=True),
+                convert_options=pacsv.ConvertOptions(strings_can_be_null=True)
+            )
+        except pa.ArrowInvalid as e:
+            logger.warning(f"pyarrow could not parse {name}, falling back to pandas: {e}")
+            return pd.read_csv(io.BytesIO(data))
+        return table.rename_columns(_pandas_style_names(table.column_names)).to_pandas()
+    try:
+        # Rust-based reader, much faster than openpyxl on large sheets
+        return pd.read_excel(io.BytesIO(data), engine="calamine")
+    except (ImportError, ValueError):  # python-calamine missing, or pandas < 2.2 ("Unknown engine")
+        return pd.read_excel(io.BytesIO(data))
+
+class _SalaryTable(dict):
+    """str.translate table reducing salary text to space-separated numbers.
+
+    Digits and "." are kept, thousands separators dropped, and any other codepoint
+    (currency symbols, NBSP, letters) becomes a space so "10-15" stays two numbers.
+    Entries are filled lazily, covering all of Unicode without a 1.1M-entry dict.
+    """
+
+    def __missing__(self, codepoint: int):
+        if chr(codepoint).isdigit():
+            raise LookupError(codepoint)  # Leave digits untouched
+        self[codepoint] = " "
+        return " "
+
+_SALARY_TABLE = _SalaryTable({ord("."): ord("."), ord(","): None})
+_SALARY_NUMBER = r"\d+(?:\.\d+)?"
+
+def normalize_salary_series(s: pd.Series) -> pd.Series:
+    """Convert salary text to numbers; values holding zero or several numbers (ranges) become NaN."""
+    text = s.astype(str).str.translate(_SALARY_TABLE)
+    single = text.str.count(_SALARY_NUMBER) == 1
+    return pd.to_numeric(text.str.extract(f"({_SALARY_NUMBER})", expand=False).where(single), errors="coerce")
+
+def slider_step(values: pd.Series) -> int:
+    """Pick a slider step from the column's 5th-95th percentile spread."""
+    values = values.to_numpy(dtype="float64", na_value=np.nan)
+    if np.isnan(values).all():
+        return 1
+    p05, p95 = np.nanpercentile(values, [5, 95])
+    spread = max(p95 - p05, 1)
+    return max(1, int(10 ** (np.floor(np.log10(spread)) - 2)))
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _and_range_inplace(mask, values, lo, hi):
+        """AND `lo <= values <= hi` into mask in a single parallel pass."""
+        for i in prange(values.shape[0]):
+            mask[i] = mask[i] and lo <= values[i] <= hi
+
+def range_selectivity(lo: float, hi: float, stats: tuple) -> float:
+    """Estimate the fraction of rows inside [lo, hi], assuming values spread evenly over min/max."""
+    min_val, max_val = stats[0], stats[1]
+    if max_val <= min_val:
+        return 1.0 if lo <= min_val <= hi else 0.0
+    return max(0.0, min(hi, max_val) - max(lo, min_val)) / (max_val - min_val)
+
+def range_mask(table: pa.Table, ranges: list, col_stats: dict) -> np.ndarray:
+    """Boolean mask of rows falling inside every (column, lo, hi) range."""
+    # Most selective predicates first, so later ones touch fewer rows
+    ranges = sorted(
+        ranges,
+        key=lambda r: range_selectivity(r[1], r[2], col_stats[r[0]]) if r[0] in col_stats else 1.0
+    )
+    if njit is not None:
+        # The kernel short-circuits on rows already rejected by earlier predicates
+        mask = np.ones(table.num_rows, dtype=np.bool_)
+        for column, lo, hi in ranges:
+            _and_range_inplace(mask, table.column(column).to_numpy(), lo, hi)
+        return mask
+
+    candidates = np.arange(table.num_rows)
+    for column, lo, hi in ranges:
+        values = table.column(column).to_numpy()[candidates]
+        candidates = candidates[(values >= lo) & (values <= hi)]
+    mask = np.zeros(table.num_rows, dtype=np.bool_)
+    mask[candidates] = True
+    return mask
+
+def filter_table(table: pa.Table, filters: dict, col_stats: dict) -> pd.DataFrame:
+    """Apply range/text filters to the table, pushed down to DuckDB when available."""
+    if duckdb is not None:
+        clauses, params = [], []
+        for column, filter_values in filters.items():
+            ident = '"' + str(column).replace('"', '""') + '"'
+            if "range" in filter_values:
+                clauses.append(f"{ident} BETWEEN ? AND ?")
+                params.extend(filter_values["range"])
+            elif "text" in filter_values:
+                # Escape LIKE wildcards so the text is matched literally
+                pattern = filter_values["text"].replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                clauses.append(f"CAST({ident} AS VARCHAR) ILIKE ? ESCAPE '\\'")
+                params.append(f"%{pattern}%")
+
+        con = duckdb.connect()
+        try:
+            con.register("uploaded", table)
+            return con.execute(f"SELECT * FROM uploaded WHERE {' AND '.join(clauses)}", params).df()
+        finally:
+            con.close()
+
+    # Build one boolean mask per filter and materialize only the matching rows
+    ranges = [(column, *values["range"]) for column, values in filters.items() if "range" in values]
+    masks = [range_mask(table, ranges, col_stats)] if ranges else []
+    for column, filter_values in filters.items():
+        if "text" in filter_values:
+            column_data = table.column(column).to_pandas()
+            if isinstance(column_data.dtype, pd.CategoricalDtype):
+                hits = column_data.cat.categories.str.contains(
+                    filter_values["text"], case=False, na=False, regex=False
+                )
+                masks.append(column_data.cat.codes.isin(np.nonzero(hits)[0]).to_numpy())
+            else:
+                masks.append(
+                    # Cast like DuckDB's CAST(... AS VARCHAR) so numeric columns can be text-searched too
+                    column_data.astype("string")
+                    .str.contains(filter_values["text"], case=False, na=False, regex=False)
+                    .to_numpy(dtype=bool)
+                )
+    return table.filter(pa.array(np.logical_and.reduce(masks))).to_pandas()
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _run_search(_table: pa.Table, _col_stats: dict, file_hash: bytes, filters_key: tuple) -> pd.DataFrame:
+    """Memoize filter results per uploaded file and filter combination."""
+    return filter_table(_table, {column: dict(values) for column, values in filters_key}, _col_stats)
+
 class SparkSearchApp:
     def __init__(self):
         """Initialize the Spark Search Application."""
-        self.setup_logging()
         self.initialize_session_state()
 
-    def setup_logging(self):
-        """Set up logging configuration."""
-        logging.basicConfig(
-            level=logging.INFO,
-            format="%(asctime)s - %(levelname)s - %(message)s",
-            filename="spark_search.log"
-        )
-        self.logger = logging.getLogger(__name__)
-
     def initialize_session_state(self):
         """Initialize session state variables.""" 
         if "db" not in st.session_state:
-            st.session_state.db = Database()
+            st.session_state.db = _get_db()
         if "search_performed" not in st.session_state:
             st.session_state.search_performed = False
         if "columns" not in st.session_state:
             st.session_state.columns = []
-        if "df" not in st.session_state:
-            st.session_state.df = None
+        if "table" not in st.session_state:
+            st.session_state.table = None
         if "results" not in st.session_state:
             st.session_state.results = pd.DataFrame()  # Empty dataframe as default
+        if "col_stats" not in st.session_state:
+            st.session_state.col_stats = {}
+        if "numeric_cols" not in st.session_state:
+            st.session_state.numeric_cols = set()
+        if "file_hash" not in st.session_state:
+            st.session_state.file_hash = None
+        if "ingested_hash" not in st.session_state:
+            st.session_state.ingested_hash = None
 
     def handle_file_upload(self, uploaded_file):
         """Handle file upload and processing."""
         try:
-            if uploaded_file.name.endswith(".csv"):
-                df = pd.read_csv(uploaded_file)
-            else:
-                df = pd.read_excel(uploaded_file)
-
-            # Update session state after file upload
-            st.session_state.df = df
-            st.session_state.columns = df.columns.tolist()
-
-            # Handle temporary file for database insertion
-            with tempfile.NamedTemporaryFile(delete=False, suffix=uploaded_file.name) as temp_file:
-                temp_file.write(uploaded_file.getvalue())
-                temp_path = temp_file.name
-
-            try:
-                success, message = st.session_state.db.insert_data(temp_path)
+            data = uploaded_file.getvalue()
+            file_hash = hashlib.blake2b(data).digest()
+
+            if st.session_state.file_hash != file_hash:
+                df = _parse_upload(data, uploaded_file.name)
+
+                # Add a numeric copy of salary text (e.g. "12 LPA", "$85,000") so Range Search applies,
+                # keeping the original column for display and the database
+                for col in df.select_dtypes(include=["object", "string"]).columns:
+                    numeric_col = f"{col} (numeric)"
+                    if "salary" in str(col).lower() and numeric_col not in df.columns:
+                        df[numeric_col] = normalize_salary_series(df[col])
+
+                # Downcast numerics to the smallest dtype (floats only when lossless)
+                for col in df.select_dtypes("integer").columns:
+                    df[col] = pd.to_numeric(df[col], downcast="integer")
+                for col in df.select_dtypes("float").columns:
+                    downcast = pd.to_numeric(df[col], downcast="float")
+                    if (downcast.eq(df[col]) | df[col].isna()).all():
+                        df[col] = downcast
+
+                # Store low-cardinality text columns as categoricals so text filters scan uniques only
+                # (pure-string columns only; any other mixed object column is left to the Arrow fallback below)
+                for col in df.select_dtypes(include=["object", "string"]).columns:
+                    if (
+                        len(df)
+                        and pd.api.types.infer_dtype(df[col], skipna=True) == "string"
+                        and df[col].nunique() / len(df) < 0.5
+                    ):
+                        df[col] = df[col].astype("category")
+
+                # Keep the upload as a compact Arrow table rather than a pandas frame
+                try:
+                    table = pa.Table.from_pandas(df, preserve_index=False)
+                except (pa.ArrowInvalid, pa.ArrowTypeError):
+                    # Mixed-type object columns (common in Excel) are stored as strings
+                    mixed = df.select_dtypes("object").columns
+                    table = pa.Table.from_pandas(df.astype({col: "string" for col in mixed}), preserve_index=False)
+
+                # Update session state after file upload
+                st.session_state.table = table
+                st.session_state.columns = table.column_names
+
+                # Precompute numeric column ranges and slider steps once instead of on every rerun;
+                # all-NaN columns (e.g. salaries that are all "Negotiable") have no usable range
+                numeric = df.select_dtypes("number")
+                st.session_state.col_stats = {
+                    str(col): (numeric[col].min(), numeric[col].max(), slider_step(numeric[col]))
+                    for col in numeric.columns
+                    if numeric[col].notna().any()
+                }
+                st.session_state.numeric_cols = set(st.session_state.col_stats)
+                st.session_state.file_hash = file_hash
+
+            # Ingest the parsed frame directly (no tempfile or second parse), retrying on later
+            # reruns until it succeeds. The database gets the frame as read from the file, before
+            # the in-app categorical/downcast transforms, like the old file-based insert did.
+            if st.session_state.ingested_hash != file_hash:
+                success, message = st.session_state.db.insert_dataframe(_parse_upload(data, uploaded_file.name))
                 if success:
+                    st.session_state.ingested_hash = file_hash
                     st.success(message, icon="✅")
                 else:
                     st.error(message, icon="❌")
-            finally:
-                try:
-                    if os.path.exists(temp_path):
-                        os.unlink(temp_path)
-                except Exception as e:
-                    self.logger.error(f"Error deleting temporary file: {e}")
 
         except Exception as e:
             st.error(f"Error processing file: {str(e)}")
-            self.logger.error(f"Error processing file: {e}")
+            logger.error(f"Error processing file: {e}")
 
     def render_sidebar(self):
         """Render sidebar with file upload and basic info."""
@@ -93,7 +418,7 @@ class SparkSearchApp:
 
     def create_search_filters(self):
         """Create and return search filters based on user input."""
-        if not st.session_state.columns or st.session_state.df is None:
+        if not st.session_state.columns or st.session_state.table is None:
             st.warning("Please upload a file first to see search options.", icon="⚠️")
             return {}, []
 
@@ -123,19 +448,23 @@ class SparkSearchApp:
                     filters[column] = {"text": text_value}
 
             elif filter_type == "Range Search":
-                column_data = st.session_state.df[column]
+                if column in st.session_state.numeric_cols:  # Covers downcast int32/float32 columns too
+                    min_val, max_val, step = st.session_state.col_stats[column]
+                    # Align the bounds to the step so both handles can reach the true min/max
+                    slider_min = int(np.floor(min_val / step) * step)
+                    slider_max = int(np.ceil(max_val / step) * step)
 
-                if column_data.dtype in ['float64', 'int64']:  # Ensure it's a numeric column
-                    min_val = column_data.min()  # Min value from the column
-                    max_val = column_data.max()  # Max value from the column
+                    if slider_min == slider_max:
+                        st.info(f"All values in '{column}' fall at {min_val}; there is no range to filter.", icon="ℹ️")
+                        continue
 
                     # Create the slider component with gliding between min and max values
                     range_val = st.slider(
                         f"{column} Range",
-                        min_value=int(min_val),
-                        max_value=int(max_val),
-                        value=(int(min_val), int(max_val)),
-                        step=1,
+                        min_value=slider_min,
+                        max_value=slider_max,
+                        value=(slider_min, slider_max),
+                        step=step,
                         key=f"range_{column}",
                         help=f"Filter {column} between {min_val} and {max_val}"
                     )
@@ -144,7 +473,7 @@ class SparkSearchApp:
                         "range": range_val
                     }
                 else:
-                    st.warning(f"The column '{column}' is not numeric. Range filter cannot be applied.", icon="⚠️")
+                    st.warning(f"The column '{column}' has no numeric values. Range filter cannot be applied.", icon="⚠️")
 
         return filters, selected_columns
 
@@ -165,44 +494,49 @@ class SparkSearchApp:
             else:
                 st.error("Invalid username or password. Please try again.", icon="❌")
 
+    @st.fragment
+    def render_search_panel(self):
+        """Render filters, search button and results; widget changes here rerun only this fragment."""
+        filters, selected_columns = self.create_search_filters()
+
+        if st.button("Search Data", use_container_width=True):
+            if filters:
+                filters_key = tuple(sorted(
+                    ((column, tuple(sorted(values.items()))) for column, values in filters.items()),
+                    key=lambda item: str(item[0])
+                ))
+                try:
+                    filtered_df = _run_search(
+                        st.session_state.table, st.session_state.col_stats, st.session_state.file_hash, filters_key
+                    )
+                except Exception as e:
+                    st.error(f"Error searching data: {str(e)}", icon="❌")
+                    logger.error(f"Error searching data: {e}")
+                    return
+
+                # Store the filtered data in session state and always display selected columns
+                st.session_state.results = filtered_df[selected_columns]  # Always show selected columns
+                st.session_state.search_performed = True
+            else:
+                # Display selected columns without any filter if no search criteria
+                st.session_state.results = st.session_state.table.select(selected_columns).to_pandas()
+                st.session_state.search_performed = True
+            st.success(f"Displaying {len(st.session_state.results)} records", icon="✅")
+
+        if st.session_state.search_performed:
+            st.subheader(f"Search Results ({len(st.session_state.results)} records)", anchor="results")
+            if not st.session_state.results.empty:
+                st.dataframe(st.session_state.results, use_container_width=True)
+            else:
+                st.warning("No results found matching your criteria.", icon="⚠️")
+
     def render_dashboard(self):
         """Render the main dashboard of the application."""
         st.title("Spark Search Platform")
         self.render_sidebar()
         
-        if st.session_state.df is not None:
-            filters, selected_columns = self.create_search_filters()
-
-            if st.button("Search Data", use_container_width=True):
-                if filters:
-                    # Filtering the dataframe based on selected range
-                    filtered_df = st.session_state.df.copy()
-
-                    # Apply the range filters to the dataframe
-                    for column, filter_values in filters.items():
-                        if "range" in filter_values:
-                            min_range, max_range = filter_values["range"]
-                            filtered_df = filtered_df[
-                                (filtered_df[column] >= min_range) & (filtered_df[column] <= max_range)
-                            ]
-                        elif "text" in filter_values:
-                            filtered_df = filtered_df[filtered_df[column].str.contains(filter_values["text"], case=False, na=False)]
-
-                    # Store the filtered data in session state and always display selected columns
-                    st.session_state.results = filtered_df[selected_columns]  # Always show selected columns
-                    st.session_state.search_performed = True
-                else:
-                    # Display selected columns without any filter if no search criteria
-                    st.session_state.results = st.session_state.df[selected_columns]
-                    st.session_state.search_performed = True
-                st.success(f"Displaying {len(st.session_state.results)} records", icon="✅")
-
-            if st.session_state.search_performed:
-                st.subheader(f"Search Results ({len(st.session_state.results)} records)", anchor="results")
-                if not st.session_state.results.empty:
-                    st.dataframe(st.session_state.results, use_container_width=True)
-                else:
-                    st.warning("No results found matching your criteria.", icon="⚠️")
+        if st.session_state.table is not None:
+            self.render_search_panel()
         else:
             st.warning("Please upload a file first.")
 
@@ -215,51 +549,9 @@ class SparkSearchApp:
             page_icon="🔍"
         )
 
-        st.markdown(
-            """
-            <style>
-                body, .stApp {
-                    background-color: #333333 !important; /* Dark Grey Background */
-                    color: white !important;
-                }
-
-                .st-emotion-cache-1v0mbdj { display: none !important; } /* Hide GitHub icon */
-
-                
-                .sidebar .sidebar-content {
-                    background-color: white !important;
-                    border-radius: 10px;
-                    padding: 20px;
-                }
-
-                h1, h2, h3, h4, h5, h6, label, .stTextInput, .stTextInput label, 
-                .stRadio label, .stCheckbox label, .stSelectbox label, .stMultiselect label {
-                    color: #2196F3 !important; /* Blue Text */
-                }
-
-                .stButton > button {
-                    background-color: #2196F3 !important; /* Blue Buttons */
-                    color: white !important;
-                    border-radius: 5px;
-                }
-
-                .stTextInput > div > input, .stSelectbox div, .stMultiselect div {
-                    background-color: white !important;
-                    border: 1px solid #2196F3 !important;
-                    color: #2196F3 !important;
-                }
-
-                .stSlider .st-bp {
-                    color: #2196F3 !important;
-                }
-
-                .stAlert {
-                    color: #2196F3 !important;
-                }
-            </style>
-            """,
-            unsafe_allow_html=True
-        )
+        # Streamlit drops elements not re-emitted on a rerun, so the style block
+        # is sent every run; the frontend sees an unchanged element and skips it.
+        st.markdown(APP_CSS, unsafe_allow_html=True)
 
         if "logged_in" not in st.session_state or not st.session_state.logged_in:
             self.render_login_page()
@@ -103,7 +103,15 @@ class Database:
                 df = pd.read_excel(file_path)
             else:
                 raise ValueError("Unsupported file format")
-            
+        except Exception as e:
+            self.logger.error(f"Error inserting data: {e}")
+            return False, f"Error inserting data: {str(e)}"
+
+        return self.insert_dataframe(df)
+
+    def insert_dataframe(self, df: pd.DataFrame) -> Tuple[bool, str]:
+        """Insert an already parsed DataFrame into the database."""
+        try:
             # Create table if not exists
             if not self.table_created:
                 self.create_table_from_df(df)
@@ -113,7 +121,7 @@ class Database:
             
             # Insert into database
             with sqlite3.connect(self.db_path) as conn:
-                df_cleaned.to_sql('resumes', conn, if_exists='replace', index=False)
+                df_cleaned.to_sql('resumes', conn, if_exists='replace', index=False, chunksize=10000)
             
             self.logger.info(f"Successfully inserted {len(df_cleaned)} records")
             return True, f"Successfully inserted {len(df_cleaned)} records"